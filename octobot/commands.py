@@ -35,6 +35,7 @@ import octobot_tentacles_manager.cli as tentacles_manager_cli
 import octobot.api.strategy_optimizer as strategy_optimizer_api
 import octobot.logger as octobot_logger
 import octobot.constants as constants
+import octobot.automation as automation
 import octobot.community.tentacles_packages as community_tentacles_packages
 import octobot.configuration_manager as configuration_manager
 
@@ -277,6 +278,7 @@ async def start_bot(bot, logger, catch=False):
     try:
         # load tentacles details
         tentacles_manager_api.reload_tentacle_info()
+        automation.Automation.invalidate_steps_cache()
         # ensure tentacles config exists or create a new one
         await tentacles_manager_api.ensure_setup_configuration(bot_install_dir=os.getcwd())
 
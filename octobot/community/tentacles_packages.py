@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import octobot.constants as constants
+import octobot.automation as automation
 import octobot_commons.logging as logging
 import octobot_tentacles_manager.api as tentacles_manager_api
 
@@ -82,6 +83,7 @@ def get_to_install_and_remove_tentacles(
     ] if can_remove_tentacles else []
     if to_remove_urls:
         tentacles_manager_api.reload_tentacle_info()
+        automation.Automation.invalidate_steps_cache()
     to_remove_tentacles = []
     for to_remove_url in to_remove_urls:
         installed_packages = tentacles_manager_api.get_installed_packages_from_url(
@@ -133,6 +133,10 @@ MAX_ALLOWED_TIME_FRAMES = int(os.getenv("MAX_ALLOWED_TIME_FRAMES", str(UNLIMITED
 MAX_ALLOWED_BACKTESTING_CANDLES_HISTORY = int(os.getenv("MAX_ALLOWED_BACKTESTING_CANDLES_HISTORY",
                                                         str(UNLIMITED_ALLOWED)))
 ENABLE_AUTOMATIONS = os_util.parse_boolean_environment_var("ENABLE_AUTOMATIONS", "True")
+# eager task factory is installed on the whole running loop: keep it opt-in
+USE_EAGER_AUTOMATION_TASKS = os_util.parse_boolean_environment_var("USE_EAGER_AUTOMATION_TASKS", "False")
+# requires the optional uvloop package, installed before creating the bot event loop
+USE_UVLOOP = os_util.parse_boolean_environment_var("USE_UVLOOP", "False")
 ENABLE_BACKTESTING = os_util.parse_boolean_environment_var("ENABLE_BACKTESTING", "True")
 ENABLE_ADVANCED_INTERFACE = os_util.parse_boolean_environment_var("ENABLE_ADVANCED_INTERFACE", "True")
 ENABLE_STRATEGY_OPTIMIZER = os_util.parse_boolean_environment_var("ENABLE_STRATEGY_OPTIMIZER", "True")
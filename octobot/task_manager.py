@@ -50,9 +50,21 @@ class TaskManager:
         self.loop_forever_thread = None
 
     def init_async_loop(self):
+        if constants.USE_UVLOOP:
+            self._install_uvloop_policy()
         self.async_loop = asyncio.new_event_loop()
         self.async_loop.set_exception_handler(self._loop_exception_handler)
 
+    def _install_uvloop_policy(self):
+        try:
+            import uvloop
+        except ImportError:
+            self.logger.warning("uvloop is not installed, using the default asyncio event loop")
+            return
+        # has to be set before creating the bot event loop
+        if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     async def start_tools_tasks(self):
         task_list = []
 
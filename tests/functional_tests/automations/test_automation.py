@@ -13,6 +13,8 @@
 #
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import asyncio
+import logging
 import pytest
 import mock
 
@@ -34,6 +36,8 @@ def automation():
 async def test_empty_initialize(automation):
     await automation.initialize()
     assert automation.automation_details == []
+    # no task to run
+    assert automation._supervisor_task is None
 
 
 def test_get_all_steps(automation):
@@ -44,6 +48,50 @@ def test_get_all_steps(automation):
     assert len(all_actions) > 2
 
 
+def test_get_all_steps_cache(automation):
+    automation.invalidate_steps_cache()
+    with mock.patch.object(octobot.automation.Automation, "_all_possible_steps", mock.Mock(return_value=[])) \
+         as _all_possible_steps_mock:
+        all_steps = automation.get_all_steps()
+        assert _all_possible_steps_mock.call_count == 3
+        # steps are cached
+        assert automation.get_all_steps() is all_steps
+        assert _all_possible_steps_mock.call_count == 3
+        with pytest.raises(TypeError):
+            all_steps[0]["step"] = None
+        steps_options = automation._get_steps_options()
+        assert steps_options == ((), (), ())
+        assert automation._get_steps_options() is steps_options
+        automation.invalidate_steps_cache()
+        assert automation.get_all_steps() is not all_steps
+        assert automation._get_steps_options() is not steps_options
+        assert _all_possible_steps_mock.call_count == 6
+    # don't keep empty steps in cache
+    automation.invalidate_steps_cache()
+
+
+def test_get_all_steps_cache_from_subclass():
+    class AutomationChild(octobot.automation.Automation):
+        pass
+
+    octobot.automation.Automation.invalidate_steps_cache()
+    with mock.patch.object(octobot.automation.Automation, "_all_possible_steps", mock.Mock(return_value=[])) \
+         as _all_possible_steps_mock:
+        all_steps = AutomationChild.get_all_steps()
+        steps_options = AutomationChild._get_steps_options()
+        # caches are shared with Automation
+        assert octobot.automation.Automation.get_all_steps() is all_steps
+        assert octobot.automation.Automation._get_steps_options() is steps_options
+        assert _all_possible_steps_mock.call_count == 3
+        # invalidating from Automation also invalidates subclasses cache
+        octobot.automation.Automation.invalidate_steps_cache()
+        assert AutomationChild.get_all_steps() is not all_steps
+        assert AutomationChild._get_steps_options() is not steps_options
+        assert _all_possible_steps_mock.call_count == 6
+    # don't keep empty steps in cache
+    octobot.automation.Automation.invalidate_steps_cache()
+
+
 @pytest.mark.asyncio
 async def test_automation_workflow(automation):
     test_config = {
@@ -83,3 +131,166 @@ async def test_automation_workflow(automation):
         automation_detail.trigger_event.get_next_event_mock.assert_awaited_once()
         automation_detail.conditions[0].evaluate_mock.assert_awaited_once()
         automation_detail.actions[0].process_mock.assert_awaited_once()
+
+
+def test_create_automation_details_ignores_out_of_range_automations(automation):
+    automation_config = {
+        automation.TRIGGER_EVENT: test_automations.TestTriggerEvent.get_name(),
+        automation.CONDITIONS: [test_automations.TestCondition.get_name()],
+        automation.ACTIONS: [test_automations.TestAction.get_name()],
+    }
+    automation.automations_config = {
+        automation.AUTOMATIONS_COUNT: 2,
+        automation.AUTOMATIONS: {
+            "3": automation_config,
+            "2": automation_config,
+            "1": {},
+        }
+    }
+    automation._create_automation_details(*automation.get_all_steps())
+    # automation 3 is out of range, automation 1 is invalid
+    assert len(automation.automation_details) == 1
+    assert isinstance(automation.automation_details[0].trigger_event, test_automations.TestTriggerEvent)
+
+
+def test_create_automation_details_ignores_automations_with_missing_steps(automation):
+    def _automation_config(event, conditions, actions):
+        return {
+            automation.TRIGGER_EVENT: event,
+            automation.CONDITIONS: conditions,
+            automation.ACTIONS: actions,
+        }
+
+    automation.automations_config = {
+        automation.AUTOMATIONS_COUNT: 4,
+        automation.AUTOMATIONS: {
+            "1": _automation_config(
+                "missing_event",
+                [test_automations.TestCondition.get_name()],
+                [test_automations.TestAction.get_name()]
+            ),
+            "2": _automation_config(
+                test_automations.TestTriggerEvent.get_name(),
+                ["missing_condition"],
+                [test_automations.TestAction.get_name()]
+            ),
+            "3": _automation_config(
+                test_automations.TestTriggerEvent.get_name(),
+                [test_automations.TestCondition.get_name()],
+                [test_automations.TestAction.get_name(), "missing_action"]
+            ),
+            "4": _automation_config(
+                test_automations.TestTriggerEvent.get_name(),
+                [test_automations.TestCondition.get_name()],
+                [test_automations.TestAction.get_name()]
+            ),
+        }
+    }
+    with mock.patch.object(automation.logger, "error", mock.Mock()) as error_mock:
+        automation._create_automation_details(*automation.get_all_steps())
+        # missing event, condition and action
+        assert error_mock.call_count == 3
+    # only the automation with all its steps is created
+    assert len(automation.automation_details) == 1
+    automation_detail = automation.automation_details[0]
+    assert automation_detail.condition_names == [test_automations.TestCondition.get_name()]
+    assert automation_detail.action_names == [test_automations.TestAction.get_name()]
+
+
+@pytest.mark.asyncio
+async def test_check_conditions_concurrently(automation):
+    async def _slow_evaluation():
+        await asyncio.sleep(10)
+        return True
+
+    slow_condition = test_automations.TestCondition()
+    slow_condition.evaluate = mock.AsyncMock(side_effect=_slow_evaluation)
+    invalid_condition = test_automations.TestCondition()
+    invalid_condition.evaluate = mock.AsyncMock(return_value=False)
+    automation_detail = octobot.automation.automation.AutomationDetails(
+        test_automations.TestTriggerEvent(), [slow_condition, invalid_condition], []
+    )
+    # invalid condition does not wait for slow condition
+    assert await asyncio.wait_for(automation._check_conditions(automation_detail), 1) is False
+    slow_condition.evaluate.assert_awaited_once()
+    invalid_condition.evaluate.assert_awaited_once()
+
+    automation_detail = octobot.automation.automation.AutomationDetails(
+        test_automations.TestTriggerEvent(), [test_automations.TestCondition(), test_automations.TestCondition()], []
+    )
+    assert await automation._check_conditions(automation_detail) is True
+    for condition in automation_detail.conditions:
+        condition.evaluate_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_process_actions_in_parallel(automation):
+    async def _slow_process():
+        await asyncio.sleep(10)
+
+    slow_action = test_automations.TestAction()
+    slow_action.process_mock.side_effect = _slow_process
+    failing_action = test_automations.TestAction()
+    failing_action.process_mock.side_effect = RuntimeError
+    action = test_automations.TestAction()
+    automation_detail = octobot.automation.automation.AutomationDetails(
+        test_automations.TestTriggerEvent(), [], [slow_action, failing_action, action]
+    )
+    with mock.patch.object(automation.logger, "exception", mock.Mock()) as exception_mock:
+        process_task = asyncio.create_task(automation._process_actions(automation_detail))
+        await asyncio_tools.wait_asyncio_next_cycle()
+        # other actions are processed without waiting for slow action
+        slow_action.process_mock.assert_awaited_once()
+        failing_action.process_mock.assert_awaited_once()
+        action.process_mock.assert_awaited_once()
+        exception_mock.assert_called_once()
+        assert not process_task.done()
+        process_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await process_task
+
+
+@pytest.mark.asyncio
+async def test_stop(automation):
+    async def _never_triggered():
+        await asyncio.sleep(10)
+
+    trigger_event = test_automations.TestTriggerEvent()
+    trigger_event.get_next_event_mock.side_effect = _never_triggered
+    automation.automation_details = [
+        octobot.automation.automation.AutomationDetails(trigger_event, [], []),
+    ]
+    with mock.patch.object(automation, "_create_automation_details", mock.Mock()):
+        await automation.start()
+    await asyncio_tools.wait_asyncio_next_cycle()
+    supervisor_task = automation._supervisor_task
+    assert not supervisor_task.done()
+    await automation.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await supervisor_task
+    assert supervisor_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_debug_logs_require_debug_flag(automation):
+    automation_logger = logging.getLogger(octobot.automation.Automation.get_name())
+    previous_level = automation_logger.level
+    automation_detail = octobot.automation.automation.AutomationDetails(
+        test_automations.TestTriggerEvent(), [test_automations.TestCondition()], []
+    )
+    try:
+        automation_logger.setLevel(logging.INFO)
+        octobot.automation.refresh_debug_flag()
+        with mock.patch.object(automation.logger, "debug", mock.Mock()) as debug_mock:
+            assert await automation._check_single_condition(automation_detail) is True
+            debug_mock.assert_not_called()
+            automation_logger.setLevel(logging.DEBUG)
+            # debug flag is not refreshed yet
+            assert await automation._check_single_condition(automation_detail) is True
+            debug_mock.assert_not_called()
+            octobot.automation.refresh_debug_flag()
+            assert await automation._check_single_condition(automation_detail) is True
+            debug_mock.assert_called_once()
+    finally:
+        automation_logger.setLevel(previous_level)
+        octobot.automation.refresh_debug_flag()